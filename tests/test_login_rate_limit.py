@@ -0,0 +1,76 @@
+import pytest
+
+import devops_app
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(devops_app.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def make_limiter(window=60, ip_limit=5, login_limit=3):
+    return devops_app.LoginRateLimiter(
+        devops_app.MemoryRateLimitBackend(), window=window, ip_limit=ip_limit, login_limit=login_limit
+    )
+
+
+def test_login_is_limited_after_login_limit_failures(clock):
+    limiter = make_limiter()
+    for _ in range(2):
+        limiter.register_failure('10.0.0.1', 'alice')
+    assert not limiter.is_limited('10.0.0.1', 'alice')
+    limiter.register_failure('10.0.0.1', 'alice')
+    assert limiter.is_limited('10.0.0.1', 'alice')
+    # Лимит по логину действует и с другого адреса
+    assert limiter.is_limited('10.0.0.2', 'alice')
+    assert not limiter.is_limited('10.0.0.2', 'bob')
+
+
+def test_ip_is_limited_across_logins(clock):
+    limiter = make_limiter()
+    for number in range(5):
+        limiter.register_failure('10.0.0.1', f'user{number}')
+    assert limiter.is_limited('10.0.0.1', 'someone-else')
+    assert not limiter.is_limited('10.0.0.2', 'someone-else')
+
+
+def test_window_slides_instead_of_resetting(clock):
+    limiter = make_limiter(window=60)
+    limiter.register_failure('10.0.0.1', 'alice')
+    clock[0] += 30
+    limiter.register_failure('10.0.0.1', 'alice')
+    limiter.register_failure('10.0.0.1', 'alice')
+    assert limiter.is_limited('10.0.0.1', 'alice')
+    # Первая попытка вышла из окна, две последние ещё в нём
+    clock[0] += 31
+    assert not limiter.is_limited('10.0.0.1', 'alice')
+    assert limiter.backend.count('login:alice', 60) == 2
+    clock[0] += 30
+    assert limiter.backend.count('login:alice', 60) == 0
+
+
+def test_is_limited_does_not_register_attempts(clock):
+    limiter = make_limiter()
+    for _ in range(10):
+        limiter.is_limited('10.0.0.1', 'alice')
+    assert limiter.backend.count('login:alice', 60) == 0
+
+
+def test_successful_login_resets_login_counter_only(clock):
+    limiter = make_limiter(ip_limit=3)
+    for _ in range(3):
+        limiter.register_failure('10.0.0.1', 'alice')
+    limiter.reset_login('alice')
+    assert limiter.backend.count('login:alice', 60) == 0
+    assert limiter.is_limited('10.0.0.1', 'bob')
+
+
+def test_memory_backend_bounds_keys(clock):
+    backend = devops_app.MemoryRateLimitBackend(max_keys=2)
+    backend.hit('a', 60)
+    backend.hit('b', 60)
+    backend.hit('c', 60)
+    assert backend.count('a', 60) == 0
+    assert backend.count('c', 60) == 1
@@ -0,0 +1,65 @@
+import threading
+import time
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+import devops_app
+
+
+@pytest.mark.parametrize('method', ['scrypt', 'pbkdf2:sha256', 'pbkdf2:sha256:1000'])
+def test_fresh_hash_does_not_need_rehash(method):
+    hasher = devops_app.PasswordHasher(workers=0, method=method)
+    assert not hasher.needs_rehash(generate_password_hash('secret', method=method))
+
+
+def test_hash_with_other_parameters_needs_rehash():
+    hasher = devops_app.PasswordHasher(workers=0, method='pbkdf2:sha256:1000')
+    assert hasher.needs_rehash(generate_password_hash('secret', method='pbkdf2:sha256:2000'))
+    assert hasher.needs_rehash(generate_password_hash('secret', method='scrypt'))
+
+
+def test_inline_hash_and_verify():
+    hasher = devops_app.PasswordHasher(workers=0, method='pbkdf2:sha256:1000')
+    password_hash = hasher.hash('secret')
+    assert hasher.verify(password_hash, 'secret')
+    assert not hasher.verify(password_hash, 'wrong')
+
+
+def test_overload_is_rejected_and_slot_is_returned():
+    hasher = devops_app.PasswordHasher(workers=0, max_pending=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=hasher._run, args=('hash', slow))
+    worker.start()
+    assert started.wait(5)
+    with pytest.raises(devops_app.HashingOverloaded):
+        hasher._run('hash', time.sleep, 0)
+    assert hasher.rejected_total == 1
+
+    release.set()
+    worker.join(5)
+    hasher._run('hash', time.sleep, 0)
+
+
+def test_share_cores_respects_explicit_setting(monkeypatch):
+    hasher = devops_app.PasswordHasher(workers=3)
+    monkeypatch.setenv('HASH_WORKERS', '3')
+    hasher.share_cores(64)
+    assert hasher.workers == 3
+
+    monkeypatch.delenv('HASH_WORKERS')
+    monkeypatch.setattr(devops_app.os, 'cpu_count', lambda: 8)
+    hasher.share_cores(4)
+    assert hasher.workers == 2
+    # Значение экспортируется для воркеров, которые импортируют модуль заново
+    assert devops_app.os.environ['HASH_WORKERS'] == '2'
+
+    monkeypatch.delenv('HASH_WORKERS')
+    hasher.share_cores(16)
+    assert hasher.workers == 1
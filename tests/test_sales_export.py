@@ -0,0 +1,71 @@
+import csv
+import io
+import zipfile
+from datetime import date
+from decimal import Decimal
+from xml.etree import ElementTree
+
+import devops_app
+
+SHEET_NS = {'s': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+
+
+def sale(sale_id, name='Гамлет', amount=Decimal('1500.50')):
+    return {
+        'id': sale_id,
+        'sale_date': date(2024, 5, sale_id),
+        'performance_name': name,
+        'tickets_count': 2,
+        'total_amount': amount,
+        'customer_name': None,
+        'status': 'completed',
+        'payment_method': 'card',
+    }
+
+
+def test_csv_has_bom_header_and_all_rows():
+    batches = [[sale(1), sale(2, name='Запятая, "кавычки"')], [sale(3)]]
+    chunks = list(devops_app.iter_sales_csv(iter(batches)))
+    # Заголовок уходит клиенту до чтения первой пачки строк
+    assert chunks[0].startswith('\ufeff'.encode('utf-8'))
+
+    rows = list(csv.reader(io.StringIO(b''.join(chunks).decode('utf-8-sig'))))
+    assert rows[0] == [title for _, title in devops_app.SALES_EXPORT_COLUMNS]
+    assert [row[0] for row in rows[1:]] == ['1', '2', '3']
+    assert rows[2][2] == 'Запятая, "кавычки"'
+    assert rows[1][5] == ''
+
+
+def test_csv_streams_one_chunk_per_batch():
+    chunks = list(devops_app.iter_sales_csv(iter([[sale(1)], [sale(2)], [sale(3)]])))
+    assert len(chunks) == 5
+    assert b'2024-05-02' in chunks[2]
+
+
+def read_sheet_rows(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        sheet = ElementTree.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+    rows = []
+    for row in sheet.iterfind('.//s:row', SHEET_NS):
+        cells = []
+        for cell in row.iterfind('s:c', SHEET_NS):
+            value = cell.find('s:v', SHEET_NS)
+            cells.append(value.text if value is not None else cell.find('s:is/s:t', SHEET_NS).text or '')
+        rows.append(cells)
+    return rows
+
+
+def test_xlsx_is_a_valid_workbook_with_typed_cells():
+    data = b''.join(devops_app.iter_sales_xlsx(iter([[sale(1)], [sale(2, name='A & <B>\x01')]])))
+    rows = read_sheet_rows(data)
+    assert rows[0] == [title for _, title in devops_app.SALES_EXPORT_COLUMNS]
+    assert rows[1][0] == '1'
+    assert rows[1][4] == '1500.50'
+    # Управляющие символы недопустимы в XML и вырезаются, спецсимволы экранируются
+    assert rows[2][2] == 'A & <B>'
+
+
+def test_xlsx_without_rows_has_only_header():
+    rows = read_sheet_rows(b''.join(devops_app.iter_sales_xlsx(iter([]))))
+    assert len(rows) == 1
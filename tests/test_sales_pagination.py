@@ -0,0 +1,60 @@
+from datetime import date
+
+import devops_app
+
+
+def make_query(page=1, after=None, before=None, per_page=10):
+    return {'filters': {}, 'filter_query': '', 'page': page, 'per_page': per_page, 'after': after, 'before': before}
+
+
+def test_cursor_round_trip():
+    cursor = devops_app.format_sales_cursor({'sale_date': date(2024, 3, 9), 'id': 42})
+    assert cursor == '2024-03-09_42'
+    assert devops_app.parse_sales_cursor(cursor) == (date(2024, 3, 9), 42)
+
+
+def test_invalid_cursors_are_ignored():
+    for value in ('', 'garbage', '2024-13-01_5', '2024-03-09_x', '2024-03-09_1_2'):
+        assert devops_app.parse_sales_cursor(value) is None
+
+
+def test_parse_sales_request_defaults_and_bad_page():
+    query = devops_app.parse_sales_request({'page': 'abc', 'performance': '3', 'after': '2024-01-02_7'})
+    assert query['page'] == 1
+    assert query['after'] == (date(2024, 1, 2), 7)
+    assert query['before'] is None
+    assert query['filter_query'] == 'performance=3'
+
+
+def test_first_page_uses_offset_and_fetches_one_extra_row():
+    sql, params = devops_app.build_sales_page_query('performance_id = %s', [3], make_query(page=3))
+    assert 'ORDER BY sale_date DESC, id DESC' in sql
+    assert params == [3, 11, 20]
+
+
+def test_after_cursor_pages_backwards_in_time_without_offset():
+    cursor = (date(2024, 5, 1), 100)
+    sql, params = devops_app.build_sales_page_query('1=1', [], make_query(page=5, after=cursor))
+    assert '(sale_date < %s OR (sale_date = %s AND id < %s))' in sql
+    # Граница по одной sale_date нужна для отсечения секций
+    assert 'sale_date <= %s' in sql
+    assert 'DESC' in sql
+    assert params == [cursor[0], cursor[0], cursor[0], 100, 11, 0]
+
+
+def test_before_cursor_reads_ascending_and_context_restores_order():
+    cursor = (date(2024, 5, 1), 100)
+    query = make_query(before=cursor, per_page=2)
+    sql, params = devops_app.build_sales_page_query('1=1', [], query)
+    assert 'ORDER BY sale_date ASC, id ASC' in sql
+    assert params[-2:] == [3, 0]
+
+    rows = [
+        {'sale_date': date(2024, 5, 1), 'id': 101},
+        {'sale_date': date(2024, 5, 2), 'id': 102},
+        {'sale_date': date(2024, 5, 3), 'id': 103},
+    ]
+    context = devops_app.sales_page_context(query, [], {'sales_count': 3}, rows)
+    assert [sale['id'] for sale in context['sales_data']] == [102, 101]
+    assert context['has_prev'] is True
+    assert context['has_next'] is True
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+import devops_app
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(devops_app.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = devops_app.TTLCache(ttl=10)
+    cache.set('key', 'value')
+    clock[0] += 9
+    assert cache.get('key') == 'value'
+    clock[0] += 2
+    assert cache.get('key') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = devops_app.TTLCache(ttl=10, max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_get_or_load_caches_value_but_not_none(clock):
+    cache = devops_app.TTLCache(ttl=10)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return None if len(calls) == 1 else 'loaded'
+
+    assert cache.get_or_load('key', loader) is None
+    assert cache.get_or_load('key', loader) == 'loaded'
+    assert cache.get_or_load('key', loader) == 'loaded'
+    assert len(calls) == 2
+
+
+def test_value_loaded_before_invalidate_is_not_cached(clock):
+    cache = devops_app.TTLCache(ttl=10)
+
+    def loader():
+        # Запись в БД и invalidate() произошли, пока шла загрузка
+        cache.invalidate()
+        return 'stale'
+
+    assert cache.get_or_load('key', loader) == 'stale'
+    assert cache.get('key') is None
+    assert cache.get_or_load('key', lambda: 'fresh') == 'fresh'
+    assert cache.get('key') == 'fresh'
+
+
+def test_invalidate_single_key_keeps_others(clock):
+    cache = devops_app.TTLCache(ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.invalidate('a')
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+
+
+def test_stale_set_with_old_generation_is_dropped(clock):
+    cache = devops_app.TTLCache(ttl=10)
+    cache.invalidate()
+    cache.set('key', 'old', generation=0)
+    assert cache.get('key') is None
+
+
+def test_async_loader_respects_invalidation(clock):
+    cache = devops_app.TTLCache(ttl=10)
+
+    async def loader():
+        cache.invalidate()
+        return 'stale'
+
+    assert asyncio.run(cache.get_or_load_async('key', loader)) == 'stale'
+    assert cache.get('key') is None